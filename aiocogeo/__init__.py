@@ -1,5 +1,6 @@
 """aiocogeo"""
 from .cog import COGReader, CompositeReader
+from .filesystems import close, close_s3
 from .stac import STACReader
 
-__all__ = ["COGReader", "CompositeReader", "STACReader"]
+__all__ = ["COGReader", "CompositeReader", "STACReader", "close", "close_s3"]
@@ -98,14 +98,12 @@ class COGReader(ReaderMixin, PartialReadInterface):
         ) as file_reader:
             self._file_reader = file_reader
             # Do the first request
-            self._file_reader.data += await self._file_reader.range_request(
-                0, config.INGESTED_BYTES_AT_OPEN, is_header=True
-            )
+            await self._file_reader.prefetch_header()
             if (await file_reader.read(2)) == b"MM":
-                file_reader._endian = ">"
-            version = await file_reader.read(2, cast_to_int=True)
+                file_reader.set_endian(">")
+            version = file_reader.read_u16()
             if version == 42:
-                first_ifd = await file_reader.read(4, cast_to_int=True)
+                first_ifd = file_reader.read_u32()
                 file_reader.seek(first_ifd)
                 await self._read_header()
             elif version == 43:
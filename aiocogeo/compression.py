@@ -78,7 +78,7 @@ class Compression(metaclass=abc.ABCMeta):
         if jpeg_table_bytes:
             if tile[0] == 0xFF and tile[1] == 0xD8:
                 # insert tables, first removing the SOI and EOI
-                tile = tile[0:2] + jpeg_table_bytes[2:-2] + tile[2:]
+                tile = b"".join((tile[0:2], jpeg_table_bytes[2:-2], tile[2:]))
             else:
                 raise Exception("Missing SOI marker for JPEG tile")
         decoded = imagecodecs.jpeg_decode(tile)
@@ -13,6 +13,7 @@ VERBOSE_LOGS: bool = False if os.getenv("VERBOSE_LOGS", "FALSE") == "FALSE" else
 # https://gdal.org/user/virtual_file_systems.html#vsicurl-http-https-ftp-files-random-access
 # Defines the number of bytes read in the first GET request at file opening
 # Can help performance when reading images with a large header
+# Range requests which fall within the bytes read while opening the file (ex. small overview tiles) are served from memory
 INGESTED_BYTES_AT_OPEN: int = int(os.getenv("INGESTED_BYTES_AT_OPEN", "16384"))
 
 # Defines the chunk size used for additional GET requests required to read the header
@@ -25,6 +26,11 @@ ENABLE_BLOCK_CACHE: bool = True if os.getenv(
 ).upper() == "TRUE" else False
 
 
+# Maximum size (in bytes) of the in-memory cache held by each open file, least recently used ranges are evicted first.
+# Defaults to 25MB, the same as GDAL's ``VSI_CACHE_SIZE``
+BLOCK_CACHE_MAX_BYTES: int = int(os.getenv("BLOCK_CACHE_MAX_BYTES", "26214400"))
+
+
 # enable caching of header requests, similar to GDAL's VSI CACHE
 # https://trac.osgeo.org/gdal/wiki/ConfigOptions#VSI_CACHE
 ENABLE_HEADER_CACHE: bool = True if os.getenv(
@@ -39,6 +45,41 @@ HTTP_MERGE_CONSECUTIVE_RANGES: bool = True if os.getenv(
     "HTTP_MERGE_CONSECUTIVE_RANGES", "FALSE"
 ).upper() == "TRUE" else False
 
+# Maximum gap (in bytes) between two internal tiles for their range requests to be merged when
+# ``HTTP_MERGE_CONSECUTIVE_RANGES`` is enabled.  Bytes within the gap are requested and discarded, so larger values trade
+# bandwidth for fewer requests.  Defaults to ``1024`` so tiles separated by small gaps (ex. GDAL's tile leader/trailer
+# bytes or an interleaved mask tile) are still merged
+HTTP_MERGE_CONSECUTIVE_THRESHOLD: int = int(
+    os.getenv("HTTP_MERGE_CONSECUTIVE_THRESHOLD", "1024")
+)
+
+
+# Maximum gap (in bytes) between an internal tile and an internal mask tile for their range requests to be merged when
+# ``HTTP_MERGE_CONSECUTIVE_RANGES`` is enabled.  GDAL often writes each mask tile right after its image tile.  Defaults
+# to ``HTTP_MERGE_CONSECUTIVE_THRESHOLD`` so image and mask tiles are merged the same way as image tiles
+MASK_MERGE_GAP: int = int(
+    os.getenv("MASK_MERGE_GAP", str(HTTP_MERGE_CONSECUTIVE_THRESHOLD))
+)
+
+# Maximum number of internal tiles requested at once by a partial read which doesn't merge range requests, remaining
+# tiles wait for a slot instead of queueing on the connection pool all at once (``0`` for no limit)
+MAX_CONCURRENT_TILE_REQUESTS: int = int(os.getenv("MAX_CONCURRENT_TILE_REQUESTS", "64"))
+
+# Maximum number of simultaneous connections opened by the HTTP session shared across files (``0`` for no limit)
+HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+
+# Maximum number of simultaneous connections opened to a single host by the shared HTTP session (``0`` for no limit)
+HTTP_MAX_CONNECTIONS_PER_HOST: int = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "0"))
+
+
+# Number of consecutive block requests which must walk forward through the file before the next ``READAHEAD_BYTES`` are
+# requested in the background, so reads which keep moving forward through the file (ex. rows of internal tiles) are
+# served from memory.  Defaults to ``0`` (read-ahead is disabled)
+READAHEAD_TRIGGER: int = int(os.getenv("READAHEAD_TRIGGER", "0"))
+
+# Number of bytes requested by each read-ahead, defaults to 1MB
+READAHEAD_BYTES: int = int(os.getenv("READAHEAD_BYTES", "1048576"))
+
 
 # Determines if internal tiles outside the bounds of the IFD are read. When set to ``TRUE`` (default), if a partial read
 # isn't fully covered by internal tiles, missing tiles will be created using the fill value defined by the
@@ -3,15 +3,19 @@ import abc
 import asyncio
 import json
 import logging
+import os
+import re
+import struct
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Callable, Dict
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 from urllib.parse import urlsplit
 
-import aiofiles
 import aiohttp
 import botocore.exceptions
-from aiocache import Cache, cached
 
 from . import config
 
@@ -37,23 +41,144 @@ logger = logging.getLogger(__name__)
 logger.setLevel(config.LOG_LEVEL)
 
 
-def config_cache(fn: Callable) -> Callable:
+# HTTP session shared across files on each event loop, along with the async generator which closes it on shutdown
+_SHARED_SESSIONS: Dict[
+    asyncio.AbstractEventLoop, Tuple[aiohttp.ClientSession, AsyncGenerator]
+] = {}
+
+# Guards the shared resources of each event loop, which may be running in different threads
+_SHARED_LOCK = threading.Lock()
+
+# S3 resource shared across files on each event loop, along with the async generator which closes it, and the lock
+# which prevents concurrent requests on the event loop from each creating a resource
+_S3_RESOURCES: Dict[asyncio.AbstractEventLoop, Tuple[Any, AsyncGenerator]] = {}
+_S3_LOCKS: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+# Thread pool for local file reads, file descriptors are only valid within this process so reads can't use the default
+# executor of the event loop (which may be a ``ProcessPoolExecutor``, see ``aiocogeo.utils.run_in_background``)
+_LOCAL_EXECUTOR = ThreadPoolExecutor(thread_name_prefix="aiocogeo-local")
+
+# Start byte, end byte and file size of a ``Content-Range`` response header (ex. ``bytes 0-1023/146515``)
+_CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-(\d+)(?:/(\d+))?")
+
+
+def _is_tracing_enabled() -> bool:
+    """Request traces are only used for debug logs, so they are skipped entirely unless ``DEBUG`` logs are enabled"""
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+def _create_trace_config() -> aiohttp.TraceConfig:
+    """Create a trace config which forwards request traces to the ``HttpFilesystem`` which sent the request"""
+
+    async def on_request_start(session, trace_config_ctx, params):
+        if isinstance(trace_config_ctx.trace_request_ctx, HttpFilesystem):
+            await trace_config_ctx.trace_request_ctx._on_request_start(
+                session, trace_config_ctx, params
+            )
+
+    async def on_request_end(session, trace_config_ctx, params):
+        if isinstance(trace_config_ctx.trace_request_ctx, HttpFilesystem):
+            await trace_config_ctx.trace_request_ctx._on_request_end(
+                session, trace_config_ctx, params
+            )
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
+
+
+async def _close_on_shutdown(resource_ctx) -> AsyncGenerator:
     """
-    Inject cache config params (https://aiocache.readthedocs.io/en/latest/decorators.html#aiocache.cached)
+    Async generator which exits ``resource_ctx`` once it is closed.  Event loops close their pending async generators
+    when shutting down (ex. at the end of ``asyncio.run``), so shared resources are closed while their event loop can
+    still close the underlying connections, even if ``aiocogeo.close`` is never called.
     """
+    try:
+        yield
+    finally:
+        await resource_ctx.__aexit__(None, None, None)
 
-    def wrap_function(*args, **kwargs):
-        is_header = kwargs.get("is_header", None)
-        if is_header and config.ENABLE_HEADER_CACHE:
-            should_cache = True
-        elif config.ENABLE_BLOCK_CACHE and not is_header:
-            should_cache = True
-        else:
-            should_cache = False
-        kwargs["cache_read"] = kwargs["cache_write"] = should_cache
-        return fn(*args, **kwargs)
 
-    return wrap_function
+def _pop_closed_loops(resources: Dict) -> List:
+    """Remove and return the shared resources of event loops which have been closed"""
+    with _SHARED_LOCK:
+        return [resources.pop(loop) for loop in list(resources) if loop.is_closed()]
+
+
+async def _get_shared_session() -> aiohttp.ClientSession:
+    """
+    Return the aiohttp session shared by every ``HttpFilesystem`` which isn't given a session, creating it on first
+    use.  Sharing the session (and its connection pool) across files avoids a new DNS lookup and TCP/TLS handshake
+    each time a file is opened.  Sessions can't be used across event loops, so each event loop has its own session.
+    Sessions left open on event loops which have since been closed are closed here, sessions of other running event
+    loops (ex. in other threads) are left to those loops.
+    """
+    loop = asyncio.get_event_loop()
+    for _, stale in _pop_closed_loops(_SHARED_SESSIONS):
+        await stale.aclose()
+    session, _ = _SHARED_SESSIONS.get(loop, (None, None))
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=config.HTTP_MAX_CONNECTIONS,
+            limit_per_host=config.HTTP_MAX_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            force_close=False,
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            trace_configs=[_create_trace_config()] if _is_tracing_enabled() else None,
+        )
+        closer = _close_on_shutdown(session)
+        await closer.asend(None)
+        with _SHARED_LOCK:
+            _SHARED_SESSIONS[loop] = (session, closer)
+    return session
+
+
+async def _get_shared_s3_resource():
+    """
+    Return the aioboto3 S3 resource shared by every ``S3Filesystem`` on the current event loop, creating it on first
+    use.  Sharing the resource avoids resolving credentials and creating a new client (and connection pool) each time a
+    file is opened.  Like HTTP sessions, only resources of event loops which have been closed are closed here.
+    """
+    loop = asyncio.get_event_loop()
+    for _, stale in _pop_closed_loops(_S3_RESOURCES):
+        await stale.aclose()
+    _pop_closed_loops(_S3_LOCKS)
+    with _SHARED_LOCK:
+        lock = _S3_LOCKS.setdefault(loop, asyncio.Lock())
+    async with lock:
+        resource, _ = _S3_RESOURCES.get(loop, (None, None))
+        if resource is None:
+            resource_ctx = aioboto3.Session().resource("s3")
+            resource = await resource_ctx.__aenter__()
+            closer = _close_on_shutdown(resource_ctx)
+            await closer.asend(None)
+            with _SHARED_LOCK:
+                _S3_RESOURCES[loop] = (resource, closer)
+    return resource
+
+
+async def close_s3() -> None:
+    """Close the S3 resource shared across files on the current event loop"""
+    with _SHARED_LOCK:
+        _, closer = _S3_RESOURCES.pop(asyncio.get_event_loop(), (None, None))
+    if closer is not None:
+        await closer.aclose()
+
+
+async def close() -> None:
+    """
+    Close the HTTP session and S3 resource shared across files on the current event loop, should be called once when
+    the application shuts down
+    """
+    with _SHARED_LOCK:
+        _, closer = _SHARED_SESSIONS.pop(asyncio.get_event_loop(), (None, None))
+    if closer is not None:
+        await closer.aclose()
+    await close_s3()
 
 
 @dataclass
@@ -65,13 +190,23 @@ class Filesystem(abc.ABC):
 
     def __post_init__(self):
         """post init"""
-        self.data: bytes = b""
+        self.data = b""
         self._offset: int = 0
-        self._endian: str = "<"
+        self.set_endian("<")
         self._total_bytes_requested: int = 0
         self._total_requests: int = 0
         self._header_size: int = 0
         self._requested_ranges = []
+        self._block_cache: "OrderedDict[Tuple[int, int], bytes]" = OrderedDict()
+        self._block_cache_bytes: int = 0
+        # Size of the file (if known), used to keep read-aheads within the file
+        self._file_size: Optional[int] = None
+        # Sequential access detection and read-ahead state
+        self._last_range_end: int = -1
+        self._seq_count: int = 0
+        self._readahead_start: int = 0
+        self._readahead_end: int = 0
+        self._readahead_task: Optional[asyncio.Task] = None
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """async context management"""
@@ -80,33 +215,127 @@ class Filesystem(abc.ABC):
     @classmethod
     def create_from_filepath(cls, filepath: str, **kwargs) -> "Filesystem":
         """Instantiate the appropriate filesystem based on filepath scheme"""
-        splits = urlsplit(filepath)
-        if splits.scheme in {"http", "https"}:
-            return HttpFilesystem(filepath, kwargs=kwargs)
-        elif splits.scheme == "s3":
-            if not has_s3:
-                raise NotImplementedError(
-                    "Package must be built with [s3] extra to read from S3"
-                )
-            return S3Filesystem(filepath, kwargs=kwargs)
-        elif not splits.scheme and not splits.netloc:
+        idx = filepath.find("://")
+        if idx <= 0:
             return LocalFilesystem(filepath, kwargs=kwargs)
-        raise NotImplementedError("Unsupported file system")
-
-    @config_cache
-    @cached(
-        cache=Cache.MEMORY,
-        key_builder=lambda fn, *args, **kwargs: f"{args[0].filepath}-{args[1]}-{args[2]}",
-    )
-    async def range_request(self, start: int, offset: int, **kwargs) -> bytes:
+        filesystem = _SCHEME_TABLE.get(filepath[:idx].lower())
+        if filesystem is None:
+            raise NotImplementedError("Unsupported file system")
+        if filesystem is S3Filesystem and not has_s3:
+            raise NotImplementedError(
+                "Package must be built with [s3] extra to read from S3"
+            )
+        return filesystem(filepath, kwargs=kwargs)
+
+    async def range_request(
+        self, start: int, offset: int, is_header: bool = False
+    ) -> bytes:
         """
-        Perform and cache a range request.
+        Perform and cache a range request.  Header and block requests are cached based on ``ENABLE_HEADER_CACHE`` and
+        ``ENABLE_BLOCK_CACHE`` respectively.
         """
+        should_cache = (
+            config.ENABLE_HEADER_CACHE if is_header else config.ENABLE_BLOCK_CACHE
+        )
+        key = (start, offset)
+        if should_cache:
+            # Ranges which were read along with the header are sliced from it
+            if start + offset < len(self.data):
+                return self.data[start : start + offset + 1]
+            cached = self._block_cache.get(key)
+            if cached is not None:
+                self._block_cache.move_to_end(key)
+                return cached
+        if not is_header and config.READAHEAD_TRIGGER > 0:
+            ahead = await self._read_ahead(start, offset)
+            if ahead is not None:
+                return ahead
         resp = await self._range_request(start, offset)
-        if kwargs.get("is_header", False):
+        if is_header:
             self._header_size += len(resp)
+        if should_cache:
+            self._cache_range(key, resp)
         return resp
 
+    def _cache_range(self, key: Tuple[int, int], data: bytes) -> None:
+        """Add a range to the cache, evicting the least recently used ranges once ``BLOCK_CACHE_MAX_BYTES`` is reached"""
+        if len(data) > config.BLOCK_CACHE_MAX_BYTES:
+            return
+        if key in self._block_cache:
+            self._block_cache_bytes -= len(self._block_cache.pop(key))
+        self._block_cache[key] = data
+        self._block_cache_bytes += len(data)
+        while self._block_cache_bytes > config.BLOCK_CACHE_MAX_BYTES:
+            _, evicted = self._block_cache.popitem(last=False)
+            self._block_cache_bytes -= len(evicted)
+
+    async def _read_ahead(self, start: int, offset: int) -> Optional[bytes]:
+        """
+        Detect sequential block requests and, after ``READAHEAD_TRIGGER`` consecutive requests, request the next
+        ``READAHEAD_BYTES`` of the file in the background.  Returns the requested range if it was already read ahead.
+        """
+        self._seq_count = self._seq_count + 1 if start == self._last_range_end + 1 else 0
+        self._last_range_end = start + offset
+        next_start = self._last_range_end + 1
+        if (
+            self._seq_count >= config.READAHEAD_TRIGGER
+            and self._file_size is not None
+            and self._readahead_end <= next_start < self._file_size
+        ):
+            # The previous read-ahead is left running, requests within it may still be waiting on it
+            self._readahead_start = next_start
+            self._readahead_end = min(
+                next_start + config.READAHEAD_BYTES, self._file_size
+            )
+            self._readahead_task = asyncio.create_task(
+                self._fetch_readahead(next_start, self._readahead_end - next_start - 1)
+            )
+
+        task, readahead_start = self._readahead_task, self._readahead_start
+        if (
+            task is not None
+            and readahead_start <= start
+            and start + offset < self._readahead_end
+        ):
+            try:
+                data = await asyncio.shield(task)
+            except asyncio.CancelledError:
+                # The read-ahead was cancelled (e.g. by ``_close``), fall back to requesting the range directly
+                if not task.cancelled():
+                    raise
+                data = None
+            position = start - readahead_start
+            if data is not None and position + offset < len(data):
+                return data[position : position + offset + 1]
+        return None
+
+    async def _fetch_readahead(self, start: int, offset: int) -> Optional[bytes]:
+        """Background range request for a read-ahead, failures are ignored and the range is requested again on use"""
+        try:
+            return await self._range_request(start, offset)
+        except Exception:
+            return None
+
+    def _cancel_readahead(self) -> None:
+        """
+        Cancel the outstanding read-ahead (if any).  A read-ahead which fails closes the filesystem from within its own
+        task, which is left to finish so requests waiting on it fall back to a direct request.
+        """
+        task = self._readahead_task
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+        self._readahead_task = None
+
+    async def prefetch_header(self, offset: Optional[int] = None) -> None:
+        """
+        Read the start of the file (``INGESTED_BYTES_AT_OPEN`` by default) in a single request.  Later range requests
+        which fall within the bytes already read are served from memory, which avoids a request per small overview tile
+        since these are written right after the header.
+        """
+        self.data = await self.range_request(
+            0, offset or config.INGESTED_BYTES_AT_OPEN, is_header=True
+        )
+
     @abc.abstractmethod
     async def request_json(self):
         """Request json data"""
@@ -124,6 +353,42 @@ class Filesystem(abc.ABC):
         """
         ...
 
+    @property
+    def data(self) -> bytes:
+        """Bytes read from the start of the file"""
+        return self._data
+
+    @data.setter
+    def data(self, value: bytes) -> None:
+        """Set the bytes read from the start of the file, along with the view integers are unpacked from"""
+        self._data = value
+        self._view = memoryview(value)
+
+    def set_endian(self, endian: str) -> None:
+        """Set the byte order of the file (``<`` or ``>``) and the integer readers specialized for it"""
+        self._endian = endian
+        self._unpack_u16 = struct.Struct(f"{endian}H").unpack_from
+        self._unpack_u32 = struct.Struct(f"{endian}I").unpack_from
+        self._unpack_u64 = struct.Struct(f"{endian}Q").unpack_from
+
+    def read_u16(self) -> int:
+        """Read an unsigned 16-bit integer from the current offset"""
+        value = self._unpack_u16(self._view, self._offset)[0]
+        self._offset += 2
+        return value
+
+    def read_u32(self) -> int:
+        """Read an unsigned 32-bit integer from the current offset"""
+        value = self._unpack_u32(self._view, self._offset)[0]
+        self._offset += 4
+        return value
+
+    def read_u64(self) -> int:
+        """Read an unsigned 64-bit integer from the current offset"""
+        value = self._unpack_u64(self._view, self._offset)[0]
+        self._offset += 8
+        return value
+
     async def read(self, offset: int, cast_to_int: bool = False):
         """
         Read from the current offset (self._offset) to the specified offset and optionally cast the result to int
@@ -151,47 +416,60 @@ class HttpFilesystem(Filesystem):
     """HTTP(s) filesystem"""
 
     async def get_session(self) -> aiohttp.ClientSession:
-        """Create or inject aiohttp session with trace config"""
-        trace_config = aiohttp.TraceConfig()
-        trace_config.on_request_start.append((self._on_request_start))
-        trace_config.on_request_end.append(self._on_request_end)
+        """Inject aiohttp session with trace config (if debug logs are enabled), or fall back to the shared session"""
         if "session" in self.kwargs:
             session = self.kwargs["session"]
-            if not session._trace_configs:
+            if not session._trace_configs and _is_tracing_enabled():
+                trace_config = _create_trace_config()
                 trace_config.freeze()
                 session._trace_configs = [trace_config]
             return session
-        return aiohttp.ClientSession(trace_configs=[trace_config])
+        return await _get_shared_session()
 
     async def _range_request(self, start: int, offset: int) -> bytes:
         """Perform a range request"""
         range_header = {"Range": f"bytes={start}-{start + offset}"}
         try:
-            async with self.session.get(self.filepath, headers=range_header) as resp:
+            async with self.session.get(
+                self.filepath, headers=range_header, trace_request_ctx=self
+            ) as resp:
                 resp.raise_for_status()
                 data = await resp.content.read()
+                content_range = resp.headers.get("Content-Range")
         except (aiohttp.ClientError, aiohttp.ClientResponseError) as e:
             await self._close()
             raise FileNotFoundError(f"File not found: {self.filepath}, cause {type(e)} : {e}") from e
+        self._total_bytes_requested += len(data)
+        self._total_requests += 1
+        if content_range:
+            m = _CONTENT_RANGE_RE.match(content_range)
+            self._requested_ranges.append((int(m.group(1)), int(m.group(2))))
+            if m.group(3):
+                self._file_size = int(m.group(3))
         return data
 
     async def request_json(self) -> Dict:
         """Request json data"""
         try:
-            async with self.session.get(self.filepath) as resp:
+            async with self.session.get(
+                self.filepath, trace_request_ctx=self
+            ) as resp:
                 resp.raise_for_status()
+                body = await resp.read()
                 data = await resp.json()
         except (aiohttp.ClientError, aiohttp.ClientResponseError) as e:
             await self._close()
             raise FileNotFoundError(f"File not found: {self.filepath}, cause {type(e)} : {e}") from e
+        self._total_bytes_requested += len(body)
+        self._total_requests += 1
         return data
 
     async def _close(self) -> None:
         """
-        Close any resources created in ``__aexit__``, allows extending ``Filesystem`` context managers past their scope
+        Close any resources created in ``__aexit__``, allows extending ``Filesystem`` context managers past their scope.
+        Sessions are either injected or shared across files, so they are left open (see ``aiocogeo.close``).
         """
-        if "session" not in self.kwargs:
-            await self.session.close()
+        self._cancel_readahead()
 
     async def __aenter__(self):
         """Async context management"""
@@ -201,6 +479,8 @@ class HttpFilesystem(Filesystem):
     async def _on_request_start(self, session, trace_config_ctx, params):
         """on-start trace"""
         trace_config_ctx.start = asyncio.get_event_loop().time()
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         if config.VERBOSE_LOGS:
             debug_statement = (
                 f"\n > {params.method} {params.url.path} HTTP/{session.version.major}.{session.version.minor}"
@@ -213,24 +493,8 @@ class HttpFilesystem(Filesystem):
 
     async def _on_request_end(self, session, trace_config_ctx, params):
         """on-end trace"""
-        if params.response.status < 400:
+        if params.response.status < 400 and logger.isEnabledFor(logging.DEBUG):
             elapsed = round(asyncio.get_event_loop().time() - trace_config_ctx.start, 3)
-            content_range = params.response.headers.get("Content-Range")
-            self._total_bytes_requested += int(
-                params.response.headers["Content-Length"]
-            )
-            self._total_requests += 1
-            if content_range:
-                self._requested_ranges.append(
-                    tuple(
-                        [
-                            int(v)
-                            for v in content_range.split(" ")[-1]
-                            .split("/")[0]
-                            .split("-")
-                        ]
-                    )
-                )
             if config.VERBOSE_LOGS:
                 debug_statement = [
                     f"\n < HTTP/{session.version.major}.{session.version.minor}"
@@ -240,6 +504,7 @@ class HttpFilesystem(Filesystem):
                 ]
                 debug_statement.append(f"\n < Duration: {elapsed}")
             else:
+                content_range = params.response.headers.get("Content-Range")
                 debug_statement = f" FINISHED REQUEST in {elapsed} seconds: <STATUS {params.response.status}> ({content_range})"
             logger.debug("".join(debug_statement))
 
@@ -249,32 +514,36 @@ class LocalFilesystem(Filesystem):
     """Local (disk) filesystem"""
 
     async def _range_request(self, start: int, offset: int) -> bytes:
-        """Perform a range request"""
+        """Perform a range request with a single positional read, which is safe to run concurrently"""
         begin = time.time()
-        await self.file.seek(start)
-        data = await self.file.read(offset + 1)
+        data = await asyncio.get_event_loop().run_in_executor(
+            _LOCAL_EXECUTOR, os.pread, self._fd, offset + 1, start
+        )
         elapsed = time.time() - begin
-        self._total_bytes_requested += offset - start + 1
+        self._total_bytes_requested += len(data)
         self._total_requests += 1
         self._requested_ranges.append((start, start + offset))
-        logger.debug(
-            f" FINISHED REQUEST in {elapsed} seconds: <STATUS 206> ({start}-{start+offset})"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f" FINISHED REQUEST in {elapsed} seconds: <STATUS 206> ({start}-{start+offset})"
+            )
         return data
 
     async def request_json(self):
         """Request json data"""
-        return json.load(self.file)
+        return json.loads(await self._range_request(0, self._file_size - 1))
 
     async def _close(self) -> None:
         """
         Close any resources created in ``__aexit__``, allows extending ``Filesystem`` context managers past their scope
         """
-        await self.file.close()
+        self._cancel_readahead()
+        os.close(self._fd)
 
     async def __aenter__(self):
         """Async context management"""
-        self.file = await aiofiles.open(self.filepath, "rb")
+        self._fd = os.open(self.filepath, os.O_RDONLY)
+        self._file_size = os.fstat(self._fd).st_size
         return self
 
 
@@ -295,7 +564,7 @@ class S3Filesystem(Filesystem):
             raise FileNotFoundError(f"File not found: {self.filepath}, cause {type(e)} : {e}") from e
         elapsed = time.time() - begin
         content_range = req["ResponseMetadata"]["HTTPHeaders"]["content-range"]
-        if not config.VERBOSE_LOGS:
+        if not config.VERBOSE_LOGS and logger.isEnabledFor(logging.DEBUG):
             status = req["ResponseMetadata"]["HTTPStatusCode"]
             logger.debug(
                 f" FINISHED REQUEST in {elapsed} seconds: <STATUS {status}> ({content_range})"
@@ -304,11 +573,10 @@ class S3Filesystem(Filesystem):
             req["ResponseMetadata"]["HTTPHeaders"]["content-length"]
         )
         self._total_requests += 1
-        self._requested_ranges.append(
-            tuple(
-                [int(v) for v in content_range.split(" ")[-1].split("/")[0].split("-")]
-            )
-        )
+        m = _CONTENT_RANGE_RE.match(content_range)
+        self._requested_ranges.append((int(m.group(1)), int(m.group(2))))
+        if m.group(3):
+            self._file_size = int(m.group(3))
         data = await req["Body"].read()
         return data
 
@@ -325,7 +593,7 @@ class S3Filesystem(Filesystem):
             raise FileNotFoundError(f"File not found: {self.filepath}, cause {type(e)} : {e}") from e
         elapsed = time.time() - begin
         content_range = req["ResponseMetadata"]["HTTPHeaders"]["content-range"]
-        if not config.VERBOSE_LOGS:
+        if not config.VERBOSE_LOGS and logger.isEnabledFor(logging.DEBUG):
             status = req["ResponseMetadata"]["HTTPStatusCode"]
             logger.debug(
                 f" FINISHED REQUEST in {elapsed} seconds: <STATUS {status}> ({content_range})"
@@ -334,24 +602,25 @@ class S3Filesystem(Filesystem):
             req["ResponseMetadata"]["HTTPHeaders"]["content-length"]
         )
         self._total_requests += 1
-        self._requested_ranges.append(
-            tuple(
-                [int(v) for v in content_range.split(" ")[-1].split("/")[0].split("-")]
-            )
-        )
+        m = _CONTENT_RANGE_RE.match(content_range)
+        self._requested_ranges.append((int(m.group(1)), int(m.group(2))))
         data = json.loads(await req["Body"].read().decode("utf-8"))
         return data
 
     async def _close(self) -> None:
         """
-        Close any resources created in ``__aexit__``, allows extending ``Filesystem`` context managers past their scope
+        Close any resources created in ``__aexit__``, allows extending ``Filesystem`` context managers past their scope.
+        The S3 resource is shared across files, so it is left open (see ``aiocogeo.close``).
         """
-        await self.resource.__aexit__("", "", "")
+        self._cancel_readahead()
 
     async def __aenter__(self):
         """Async context management"""
         splits = urlsplit(self.filepath)
-        session = aioboto3.Session()
-        self.resource = await session.resource("s3").__aenter__()
-        self.object = await self.resource.Object(splits.netloc, f"{splits.netloc}/{splits.path[1:]}")
+        self.resource = await _get_shared_s3_resource()
+        self.object = await self.resource.Object(splits.netloc, splits.path.lstrip("/"))
         return self
+
+
+# Filesystem used to read each supported filepath scheme
+_SCHEME_TABLE = {"http": HttpFilesystem, "https": HttpFilesystem, "s3": S3Filesystem}
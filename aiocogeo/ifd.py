@@ -48,14 +48,14 @@ class IFD:
     async def read(cls, file_reader: Filesystem) -> Union["ImageIFD", "MaskIFD"]:
         """Read the IFD"""
         ifd_start = file_reader.tell()
-        tag_count = await file_reader.read(2, cast_to_int=True)
+        tag_count = file_reader.read_u16()
         tiff_tags = {}
         for idx in range(tag_count):
             tag = await Tag.read(file_reader)
             if tag:
                 tiff_tags[tag.name] = tag
         file_reader.seek(ifd_start + (12 * tag_count) + 2)
-        next_ifd_offset = await file_reader.read(4, cast_to_int=True)
+        next_ifd_offset = file_reader.read_u32()
 
         if "GeoKeyDirectoryTag" in tiff_tags:
             tiff_tags["geo_keys"] = GeoKeyDirectory.read(
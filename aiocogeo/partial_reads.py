@@ -10,8 +10,17 @@ import numpy as np
 from PIL import Image
 
 from . import config
+from .errors import TileNotFoundError
 from .ifd import ImageIFD, MaskIFD
-from .utils import run_in_background
+from .utils import run_in_background, run_with_concurrency
+
+try:
+    import cv2
+
+    # Only nearest neighbour resampling (``INTER_NEAREST_EXACT``) matches PIL exactly, other methods are left to PIL
+    has_cv2 = hasattr(cv2, "INTER_NEAREST_EXACT")
+except ModuleNotFoundError:
+    has_cv2 = False
 
 NpArrayType = Union[np.ndarray, np.ma.masked_array]
 
@@ -42,8 +51,8 @@ class TileMetadata:
     ovr_level: int
 
     # coordinate grid of final partial read
-    x_coord: list[float]
-    y_coord: list[float]
+    x_coord: np.ndarray
+    y_coord: np.ndarray
 
 
 @dataclass
@@ -207,24 +216,35 @@ class PartialReadBase(abc.ABC):
             bands=band_count,
             dtype=dtype,
             ovr_level=ovr_level,
-            x_coord=[_tlx + (xorigin + 0.5 + q) * geotransform.a for q in range(0, width)],
-            y_coord=[_tly + (yorigin + 0.5 + q) * geotransform.e for q in range(0, height)]
+            x_coord=(np.arange(width, dtype=np.float64) + (xorigin + 0.5))
+            * geotransform.a
+            + _tlx,
+            y_coord=(np.arange(height, dtype=np.float64) + (yorigin + 0.5))
+            * geotransform.e
+            + _tly,
         )
 
-    def _init_array(self, img_tiles: TileMetadata) -> NpArrayType:
+    def _init_array(
+        self, img_tiles: TileMetadata, fill_value: Optional[int] = None
+    ) -> NpArrayType:
         """
         Initialize an empty numpy array with the same shape of the partial read.  Individual blocks are mosaiced into
-        this array as they are requested
+        this array as they are requested, so it is left uninitialized unless a ``fill_value`` is provided for blocks
+        which won't be requested.
         """
-        fused = np.zeros(
-            (
-                img_tiles.bands,
-                (img_tiles.ymax + 1 - img_tiles.ymin) * img_tiles.tile_height,
-                (img_tiles.xmax + 1 - img_tiles.xmin) * img_tiles.tile_width,
-            )
-        ).astype(img_tiles.dtype)
+        shape = (
+            img_tiles.bands,
+            (img_tiles.ymax + 1 - img_tiles.ymin) * img_tiles.tile_height,
+            (img_tiles.xmax + 1 - img_tiles.xmin) * img_tiles.tile_width,
+        )
+        if fill_value is None:
+            fused = np.empty(shape, dtype=img_tiles.dtype)
+        else:
+            fused = np.full(shape, fill_value, dtype=img_tiles.dtype)
         if self._add_mask:
-            fused = np.ma.masked_array(fused)
+            fused = np.ma.masked_array(
+                fused, mask=np.zeros(shape, dtype=bool), copy=False
+            )
         return fused
 
     @staticmethod
@@ -237,17 +257,19 @@ class PartialReadBase(abc.ABC):
         tile_height: int,
     ) -> None:
         """Mosaic an array into a larger array"""
-        fused_arr[
-            :,
-            idy * tile_height : (idy + 1) * tile_height,
-            idx * tile_width : (idx + 1) * tile_width,
-        ] = arr
-        if np.ma.is_masked(arr):
-            fused_arr.mask[
-                :,
-                idy * tile_height : (idy + 1) * tile_height,
-                idx * tile_width : (idx + 1) * tile_width,
-            ] = arr.mask
+        window = (
+            slice(None),
+            slice(idy * tile_height, (idy + 1) * tile_height),
+            slice(idx * tile_width, (idx + 1) * tile_width),
+        )
+        # Copy data and mask back-to-back into the same window; the fused mask is initialized to False so only
+        # tiles which carry a mask need the second write
+        np.copyto(
+            np.ma.getdata(fused_arr)[window], np.ma.getdata(arr), casting="unsafe"
+        )
+        mask = np.ma.getmask(arr)
+        if mask is not np.ma.nomask:
+            np.copyto(fused_arr.mask[window], mask)
 
     async def _get_and_stitch_tile(
         self,
@@ -265,18 +287,20 @@ class PartialReadBase(abc.ABC):
         )
 
     async def _request_tiles(self, img_tiles: TileMetadata) -> NpArrayType:
-        """Concurrently request the image tiles and mosaic into a larger array"""
+        """
+        Concurrently request the image tiles and mosaic into a larger array, at most ``MAX_CONCURRENT_TILE_REQUESTS``
+        tiles are requested at once
+        """
         img_arr = self._init_array(img_tiles)
-        tile_tasks = []
-        for idx, xtile in enumerate(range(img_tiles.xmin, img_tiles.xmax + 1)):
-            for idy, ytile in enumerate(range(img_tiles.ymin, img_tiles.ymax + 1)):
-                get_tile_task = asyncio.create_task(
-                    self._get_and_stitch_tile(
-                        xtile, ytile, idx, idy, img_tiles, img_arr
-                    )
-                )
-                tile_tasks.append(get_tile_task)
-        await asyncio.gather(*tile_tasks)
+        await run_with_concurrency(
+            self._get_and_stitch_tile,
+            (
+                (xtile, ytile, idx, idy, img_tiles, img_arr)
+                for idx, xtile in enumerate(range(img_tiles.xmin, img_tiles.xmax + 1))
+                for idy, ytile in enumerate(range(img_tiles.ymin, img_tiles.ymax + 1))
+            ),
+            config.MAX_CONCURRENT_TILE_REQUESTS,
+        )
         return img_arr
 
     def _clip_array(self, arr: NpArrayType, img_tiles: TileMetadata) -> NpArrayType:
@@ -295,6 +319,13 @@ class PartialReadBase(abc.ABC):
         resample_method: int,
     ) -> NpArrayType:
         """Resample a numpy array to the desired shape"""
+        # PIL's 16 bit integer images round nearest neighbour coordinates differently, so are left to PIL
+        if (
+            has_cv2
+            and resample_method == Image.NEAREST
+            and img_tiles.dtype != np.uint16
+        ):
+            return self._resample_cv2(clipped, img_tiles, out_shape)
         _clipped = np.rollaxis(clipped, 0, 3)
         if clipped.shape[0] == 1:
             _clipped = np.squeeze(_clipped, axis=2)
@@ -313,6 +344,41 @@ class PartialReadBase(abc.ABC):
             resized = np.ma.masked_array(resized, resized_mask)
         return resized
 
+    def _resample_cv2(
+        self,
+        clipped: NpArrayType,
+        img_tiles: TileMetadata,
+        out_shape: Tuple[int, int],
+    ) -> NpArrayType:
+        """
+        Resample a numpy array to the desired shape with OpenCV nearest neighbour resampling.  Each band is resized
+        directly into the output array, which avoids moving the bands to the last axis (and back) like PIL requires.
+        """
+        data = np.ma.getdata(clipped)
+        resized = np.empty(
+            (clipped.shape[0], out_shape[1], out_shape[0]), dtype=img_tiles.dtype
+        )
+        for band in range(clipped.shape[0]):
+            cv2.resize(
+                data[band],
+                (out_shape[0], out_shape[1]),
+                dst=resized[band],
+                interpolation=cv2.INTER_NEAREST_EXACT,
+            )
+        if clipped.shape[0] == 1:
+            resized = resized[0]
+        if self._add_mask:
+            resized_mask = cv2.resize(
+                clipped.mask[0, ...].view(np.uint8),
+                (out_shape[0], out_shape[1]),
+                interpolation=cv2.INTER_NEAREST_EXACT,
+            ).view(bool)
+            # The mask is the same for each band, copied so callers may modify it
+            resized = np.ma.masked_array(
+                resized, np.broadcast_to(resized_mask, resized.shape).copy()
+            )
+        return resized
+
     def _postprocess(
         self,
         arr: NpArrayType,
@@ -339,23 +405,67 @@ class PartialReadInterface(PartialReadBase):
 
     @staticmethod
     def _extract_tile(
-        ifd: Union[ImageIFD, MaskIFD], img_bytes: bytes, tile_index: int, offset: int
-    ) -> bytes:
-        """Extract a tile from the merged range request"""
+        ifd: Union[ImageIFD, MaskIFD],
+        img_bytes: memoryview,
+        tile_index: int,
+        offset: int,
+    ) -> memoryview:
+        """Extract a tile from the merged range request without copying it"""
         byte_count = ifd.TileByteCounts[tile_index]
         tile_start = ifd.TileOffsets[tile_index] - offset
-        tile_bytes = img_bytes[tile_start : tile_start + byte_count]
-        return tile_bytes
+        return img_bytes[tile_start : tile_start + byte_count]
 
     @staticmethod
     def _merge_range_requests(
-        ifd: Union[ImageIFD, MaskIFD], tile_indices: List[int], offset: int
-    ) -> Tuple[int, int]:
-        """Determine offset and byte count for a range request across given tile indices"""
-        byte_count = (
-            ifd.TileOffsets[max(tile_indices)] + ifd.TileByteCounts[max(tile_indices)]
+        offsets: List[int], byte_counts: List[int], is_mask: Optional[List[bool]] = None
+    ) -> List[Tuple[int, int, List[int]]]:
+        """
+        Coalesce byte ranges into as few range requests as possible.  Ranges are sorted by offset and merged whenever
+        the gap between them is no larger than ``HTTP_MERGE_CONSECUTIVE_THRESHOLD``, or ``MASK_MERGE_GAP`` between an
+        image tile and a mask tile.  Returns the start and (exclusive) end of each merged span along with the positions
+        of the ranges it contains.
+        """
+        spans = []
+        previous = None
+        for position in sorted(range(len(offsets)), key=offsets.__getitem__):
+            start = offsets[position]
+            end = start + byte_counts[position]
+            max_gap = config.HTTP_MERGE_CONSECUTIVE_THRESHOLD
+            if is_mask and previous is not None:
+                if is_mask[position] != is_mask[previous]:
+                    max_gap = max(max_gap, config.MASK_MERGE_GAP)
+            if spans and start - spans[-1][1] <= max_gap:
+                spans[-1][1] = max(spans[-1][1], end)
+                spans[-1][2].append(position)
+            else:
+                spans.append([start, end, [position]])
+            previous = position
+        return [(start, end, positions) for (start, end, positions) in spans]
+
+    async def _request_merged_ranges(
+        self, tiles: List[Tuple[Union[ImageIFD, MaskIFD], int]]
+    ) -> List[memoryview]:
+        """
+        Request tiles (pairs of IFD and tile index) with merged range requests, returning a view over the bytes of each
+        tile in the order requested
+        """
+        spans = self._merge_range_requests(
+            [ifd.TileOffsets[idx] for (ifd, idx) in tiles],
+            [ifd.TileByteCounts[idx] for (ifd, idx) in tiles],
+            [isinstance(ifd, MaskIFD) for (ifd, _) in tiles],
         )
-        return (offset, byte_count - offset - 1)
+        responses = await run_with_concurrency(
+            self._file_reader.range_request,
+            [(start, end - start - 1) for (start, end, _) in spans],
+            config.MAX_CONCURRENT_TILE_REQUESTS,
+        )
+        tile_bytes = [None] * len(tiles)
+        for (start, _, positions), response in zip(spans, responses):
+            response = memoryview(response)
+            for position in positions:
+                ifd, idx = tiles[position]
+                tile_bytes[position] = self._extract_tile(ifd, response, idx, start)
+        return tile_bytes
 
     async def _request_merged_tile(
         self,
@@ -364,49 +474,40 @@ class PartialReadInterface(PartialReadBase):
         img_tiles: TileMetadata,
     ) -> None:
         """Request a range, extract/decompress/mosaic each tile"""
-        tile_indices = [idx[0] for idx in indices]
         # Request image data
-        futures = []
         ifd = self.ifds[img_tiles.ovr_level]
-        offset = ifd.TileOffsets[min(tile_indices)]
-        tile_task = asyncio.create_task(
-            self._file_reader.range_request(
-                *self._merge_range_requests(ifd, tile_indices, offset)
-            )
-        )
-        futures.append(tile_task)
-
-        if self._add_mask:
-            # Request mask data
+        tiles = [(ifd, idx[0]) for idx in indices]
+        if self.is_masked:
+            # Request mask data, mask tiles are often written next to their image tile so they are merged together
             mask_ifd = self.mask_ifds[img_tiles.ovr_level]
-            mask_offset = mask_ifd.TileOffsets[min(tile_indices)]
-            mask_task = asyncio.create_task(
-                self._file_reader.range_request(
-                    *self._merge_range_requests(mask_ifd, tile_indices, mask_offset)
-                )
-            )
-            futures.append(mask_task)
-
-        response = await asyncio.gather(*futures)
-
-        # Compression is applied to each block, so we need to extract and decompress each tile in the merged request
-        # TODO: Parallelize
-        for (tile_idx, idx, idy) in indices:
-            # Extract the tile
-            tile_bytes = self._extract_tile(ifd, response[0], tile_idx, offset)
-            # Decompress the tile
-            decoded = await run_in_background(ifd._decompress, tile_bytes)
-            if self._add_mask:
-                # Extract mask
-                mask_ifd = self.mask_ifds[img_tiles.ovr_level]
-                mask_bytes = self._extract_tile(
-                    mask_ifd, response[1], tile_idx, mask_offset
-                )
-                # Decompress and apply mask
-                mask_decoded = await run_in_background(ifd._decompress_mask, mask_bytes)
+            tiles += [(mask_ifd, idx[0]) for idx in indices]
+        tile_bytes = await self._request_merged_ranges(tiles)
+        response = [tile_bytes[: len(indices)], tile_bytes[len(indices) :]]
+
+        # Compression is applied to each block, so we need to decompress each tile in the merged request.  Tiles are
+        # independent of each other so they are all submitted to the executor at once.
+        mask_bytes = response[1] if self.is_masked else []
+        decoded_tiles, decoded_masks = await asyncio.gather(
+            asyncio.gather(
+                *[run_in_background(ifd._decompress, b) for b in response[0]]
+            ),
+            asyncio.gather(
+                *[run_in_background(ifd._decompress_mask, b) for b in mask_bytes]
+            ),
+        )
+        for position, (_, idx, idy) in enumerate(indices):
+            decoded = decoded_tiles[position]
+            # Prioritize internal mask over nodata
+            if self.is_masked:
+                # Apply mask, inverting once per tile and broadcasting the (H, W) mask across bands as a view
+                inverted = decoded_masks[position] == 0
                 decoded = np.ma.masked_array(
-                    decoded, np.invert(np.broadcast_to(mask_decoded, decoded.shape))
+                    decoded,
+                    mask=np.broadcast_to(inverted, decoded.shape),
+                    copy=False,
                 )
+            elif self.nodata is not None:
+                decoded = np.ma.masked_where(decoded == self.nodata, decoded)
             # Mosaic
             self._stitch_image_tile(
                 decoded, arr, idx, idy, img_tiles.tile_width, img_tiles.tile_height
@@ -414,20 +515,34 @@ class PartialReadInterface(PartialReadBase):
 
     async def _request_merged_tiles(self, img_tiles: TileMetadata) -> NpArrayType:
         """Do a partial read with merged range requests"""
-        futures = []
         ifd = self.ifds[img_tiles.ovr_level]
-        # Create the array
-        img_arr = self._init_array(img_tiles)
-        for idy, ytile in enumerate(range(img_tiles.ymin, img_tiles.ymax + 1)):
-            # Merge requests across rows
-            indices = []
-            for idx, xtile in enumerate(range(img_tiles.xmin, img_tiles.xmax + 1)):
-                tile_index = (ytile * ifd.tile_count[0]) + xtile
-                indices.append((tile_index, idx, idy))
-            # Do the request
-            merged_tile_task = asyncio.create_task(
-                self._request_merged_tile(img_arr, indices, img_tiles)
+        xmax, ymax = ifd.tile_count
+        boundless = (
+            img_tiles.xmin < 0
+            or img_tiles.ymin < 0
+            or img_tiles.xmax >= xmax
+            or img_tiles.ymax >= ymax
+        )
+        # Create the array, tiles outside bounds of the image are never requested so they are filled instead
+        img_arr = self._init_array(
+            img_tiles, config.BOUNDLESS_READ_FILL_VALUE if boundless else None
+        )
+        # Merge requests across the whole tile grid, the index of each internal tile is computed for the grid at once
+        xtiles = np.arange(img_tiles.xmin, img_tiles.xmax + 1)
+        ytiles = np.arange(img_tiles.ymin, img_tiles.ymax + 1)
+        in_bounds = ((ytiles >= 0) & (ytiles < ymax))[:, None] & (
+            (xtiles >= 0) & (xtiles < xmax)
+        )[None, :]
+        if boundless and not config.BOUNDLESS_READ:
+            idy, idx = np.argwhere(~in_bounds)[0]
+            raise TileNotFoundError(
+                f"Internal tile {img_tiles.ovr_level}/{xtiles[idx]}/{ytiles[idy]} does not exist"
             )
-            futures.append(merged_tile_task)
-        await asyncio.gather(*futures)
+        tile_indices = ytiles[:, None] * xmax + xtiles[None, :]
+        idys, idxs = np.nonzero(in_bounds)
+        indices = list(
+            zip(tile_indices[idys, idxs].tolist(), idxs.tolist(), idys.tolist())
+        )
+        # Do the request
+        await self._request_merged_tile(img_arr, indices, img_tiles)
         return img_arr
@@ -5,7 +5,7 @@ from functools import wraps
 
 import typer
 
-from aiocogeo import COGReader
+from aiocogeo import COGReader, close
 
 app = typer.Typer()
 
@@ -15,7 +15,13 @@ def coro(f):
 
     @wraps(f)
     def wrapper(*args, **kwargs):
-        return asyncio.run(f(*args, **kwargs))
+        async def run():
+            try:
+                return await f(*args, **kwargs)
+            finally:
+                await close()
+
+        return asyncio.run(run())
 
     return wrapper
 
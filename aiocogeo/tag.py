@@ -63,16 +63,16 @@ class Tag(BaseTag):
     async def read(cls, reader: Filesystem) -> Optional["Tag"]:
         """Read a TIFF Tag"""
         # 0-2 bytes of tag are tag name
-        code = await reader.read(2, cast_to_int=True)
+        code = reader.read_u16()
         if code not in TIFF_TAGS:
             logger.warning(f"TIFF TAG {code} is not supported.")
             reader.incr(10)
             return None
         name = TIFF_TAGS[code]
         # 2-4 bytes are field type
-        field_type = TAG_TYPES[(await reader.read(2, cast_to_int=True))]
+        field_type = TAG_TYPES[reader.read_u16()]
         # 4-8 bytes are number of values
-        count = await reader.read(4, cast_to_int=True)
+        count = reader.read_u32()
         length = field_type.size * count
         if length <= 4:
             data = await reader.read(length)
@@ -87,7 +87,7 @@ class Tag(BaseTag):
 
         else:
             # value is elsewhere in the file, `value_offset` tells us where it is
-            value_offset = await reader.read(4, cast_to_int=True)
+            value_offset = reader.read_u32()
             end_of_tag = reader.tell()
 
             # read more data if we need to
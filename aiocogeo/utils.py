@@ -1,7 +1,7 @@
 """aiocogeo.utils"""
 import asyncio
 from functools import partial
-from typing import Any, Callable, List
+from typing import Any, Awaitable, Callable, Iterable, List, Tuple
 
 
 async def run_in_background(func: Callable, *args: Any, **kwargs: Any) -> Any:
@@ -19,6 +19,28 @@ async def run_in_background(func: Callable, *args: Any, **kwargs: Any) -> Any:
     return await loop.run_in_executor(None, func)
 
 
+async def run_with_concurrency(
+    func: Callable[..., Awaitable[Any]], args: Iterable[Tuple], limit: int
+) -> List[Any]:
+    """
+    Await ``func(*arg)`` for each tuple of arguments in ``args`` with at most ``limit`` calls running at once, returning
+    the results in the same order.  Only ``limit`` worker coroutines are created, each pulling the next arguments from a
+    shared iterator, rather than a task per call.  A ``limit`` of ``0`` (or less) runs every call at once.
+    """
+    args = list(args)
+    if limit <= 0:
+        limit = len(args)
+    results = [None] * len(args)
+    queue = iter(enumerate(args))
+
+    async def worker():
+        for position, arg in queue:
+            results[position] = await func(*arg)
+
+    await asyncio.gather(*[worker() for _ in range(min(limit, len(args)))])
+    return results
+
+
 def chunks(lst: List, n: int):
     """Yield successive n-sized chunks from lst."""
     for i in range(0, len(lst), n):
@@ -6,6 +6,7 @@ with open("README.md") as f:
 
 extras = {
     "s3": ["aioboto3"],
+    "opencv": ["opencv-python-headless"],
     "dev": [
         "mercantile",
         "morecantile",
@@ -44,9 +45,7 @@ setup(
     include_package_data=True,
     install_requires=[
         "aioboto3",
-        "aiofiles",
         "aiohttp<=3.6.2",
-        "aiocache",
         "affine",
         "imagecodecs",
         "typer",
@@ -1,6 +1,12 @@
+import asyncio
+import os
+
 import pytest
 
 from aiocogeo import config
+from aiocogeo.filesystems import Filesystem
+
+from .conftest import DATA_DIR
 
 
 @pytest.mark.asyncio
@@ -11,11 +17,16 @@ async def test_block_cache_enabled(create_cog_reader, monkeypatch):
     async with create_cog_reader(infile) as cog:
         assert cog.requests["count"] == 2
         await cog.get_tile(0, 0, 0)
+        request_count = cog.requests["count"]
 
-    async with create_cog_reader(infile) as cog:
         await cog.get_tile(0, 0, 0)
         # Confirm all requests are cached
-        assert cog.requests["count"] == 2
+        assert cog.requests["count"] == request_count
+
+    # Cache is held by each file
+    async with create_cog_reader(infile) as cog:
+        await cog.get_tile(0, 0, 0)
+        assert cog.requests["count"] == request_count
 
 
 @pytest.mark.asyncio
@@ -29,6 +40,44 @@ async def test_block_cache_disabled(create_cog_reader):
         assert cog.requests["count"] == request_count + 1
 
 
+@pytest.mark.asyncio
+async def test_block_cache_max_bytes(monkeypatch):
+    monkeypatch.setattr(config, "ENABLE_BLOCK_CACHE", True)
+    monkeypatch.setattr(config, "BLOCK_CACHE_MAX_BYTES", 10)
+    async with Filesystem.create_from_filepath(
+        os.path.join(DATA_DIR, "cog.tif")
+    ) as file_reader:
+        file_reader._cache_range((0, 3), b"0000")
+        file_reader._cache_range((4, 3), b"1111")
+        file_reader._cache_range((8, 3), b"2222")
+        # Least recently used range is evicted
+        assert list(file_reader._block_cache) == [(4, 3), (8, 3)]
+        assert file_reader._block_cache_bytes == 8
+
+        # Cache hits are marked as recently used
+        assert await file_reader.range_request(4, 3) == b"1111"
+        assert file_reader._total_requests == 0
+        file_reader._cache_range((12, 3), b"3333")
+        assert list(file_reader._block_cache) == [(4, 3), (12, 3)]
+
+        # Ranges larger than the cache are never cached
+        file_reader._cache_range((16, 11), b"4" * 12)
+        assert (16, 11) not in file_reader._block_cache
+        await file_reader._close()
+
+
+@pytest.mark.asyncio
+async def test_block_cache_header(create_cog_reader, monkeypatch):
+    monkeypatch.setattr(config, "ENABLE_BLOCK_CACHE", True)
+    async with create_cog_reader(os.path.join(DATA_DIR, "cog.tif")) as cog:
+        # Overview tiles written right after the header are read along with it
+        ifd = cog.ifds[1]
+        assert ifd.TileOffsets[0] + ifd.TileByteCounts[0] <= len(cog._file_reader.data)
+        request_count = cog.requests["count"]
+        await cog.get_tile(0, 0, 1)
+        assert cog.requests["count"] == request_count
+
+
 @pytest.mark.asyncio
 async def test_header_cache_enabled(create_cog_reader, monkeypatch):
     # Cache is disabled for tests
@@ -37,12 +86,15 @@ async def test_header_cache_enabled(create_cog_reader, monkeypatch):
     async with create_cog_reader(infile) as cog:
         assert cog.requests["count"] == 2
 
-    async with create_cog_reader(infile) as cog:
-        assert cog.requests["count"] == 0
+        # Header requests are served from the cache
+        await cog._file_reader.range_request(
+            0, config.INGESTED_BYTES_AT_OPEN, is_header=True
+        )
+        assert cog.requests["count"] == 2
 
-    async with create_cog_reader(infile) as cog:
+        # Block requests are not
         await cog.get_tile(0, 0, 0)
-        assert cog.requests["count"] == 1
+        assert cog.requests["count"] == 3
 
 
 @pytest.mark.asyncio
@@ -51,5 +103,64 @@ async def test_header_cache_disabled(create_cog_reader):
     async with create_cog_reader(infile) as cog:
         assert cog.requests["count"] == 2
 
+        await cog._file_reader.range_request(
+            0, config.INGESTED_BYTES_AT_OPEN, is_header=True
+        )
+        assert cog.requests["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_readahead(create_cog_reader, monkeypatch):
+    monkeypatch.setattr(config, "READAHEAD_TRIGGER", 2)
+    monkeypatch.setattr(config, "READAHEAD_BYTES", 4096)
+    infile = "https://async-cog-reader-test-data.s3.amazonaws.com/lzw_cog.tif"
     async with create_cog_reader(infile) as cog:
-        assert cog.requests["count"] == 2
+        file_reader = cog._file_reader
+        start = len(file_reader.data)
+        request_count = cog.requests["count"]
+        ranges = [
+            await file_reader.range_request(start + idx * 1024, 1023)
+            for idx in range(6)
+        ]
+        # The third sequential request triggers a read-ahead which serves the remaining requests
+        assert cog.requests["count"] == request_count + 4
+        assert ranges[-1] == await file_reader._range_request(start + 5 * 1024, 1023)
+
+
+@pytest.mark.asyncio
+async def test_readahead_failure(monkeypatch):
+    monkeypatch.setattr(config, "READAHEAD_TRIGGER", 2)
+    monkeypatch.setattr(config, "READAHEAD_BYTES", 4096)
+    infile = os.path.join(DATA_DIR, "cog.tif")
+    async with Filesystem.create_from_filepath(infile) as file_reader:
+        range_request = file_reader._range_request
+
+        async def _range_request(start, offset):
+            if offset == config.READAHEAD_BYTES - 1:
+                # Fail after the next request starts waiting on the read-ahead, HTTP and S3 filesystems close
+                # themselves (cancelling the read-ahead) when a request fails
+                await asyncio.sleep(0.01)
+                file_reader._cancel_readahead()
+                raise OSError("read-ahead failed")
+            return await range_request(start, offset)
+
+        monkeypatch.setattr(file_reader, "_range_request", _range_request)
+        ranges = [
+            await file_reader.range_request(idx * 1024, 1023) for idx in range(6)
+        ]
+
+    # Ranges within the failed read-ahead are requested directly
+    with open(infile, "rb") as f:
+        assert b"".join(ranges) == f.read(6 * 1024)
+
+
+@pytest.mark.asyncio
+async def test_local_filesystem_bytes_requested():
+    infile = os.path.join(DATA_DIR, "cog.tif")
+    file_size = os.path.getsize(infile)
+    async with Filesystem.create_from_filepath(infile) as file_reader:
+        # Ranges past the end of the file only count the bytes which were read
+        data = await file_reader.range_request(file_size - 100, 1023)
+        assert len(data) == 100
+        assert file_reader._total_bytes_requested == 100
+        assert file_reader._total_requests == 1
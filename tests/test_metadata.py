@@ -1,3 +1,5 @@
+import struct
+
 import pytest
 import rasterio
 from morecantile.models import TileMatrixSet
@@ -5,6 +7,12 @@ from morecantile.models import TileMatrixSet
 from aiocogeo import config
 from aiocogeo.constants import MaskFlags
 from aiocogeo.errors import InvalidTiffError
+from aiocogeo.filesystems import (
+    Filesystem,
+    HttpFilesystem,
+    LocalFilesystem,
+    S3Filesystem,
+)
 from aiocogeo.ifd import IFD
 from aiocogeo.tag import BaseTag
 
@@ -183,6 +191,36 @@ async def test_file_not_found(create_cog_reader, infile):
             ...
 
 
+@pytest.mark.parametrize(
+    "infile,filesystem",
+    [
+        ("/local/file.tif", LocalFilesystem),
+        ("relative/file.tif", LocalFilesystem),
+        ("http://cogsarecool.com/cog.tif", HttpFilesystem),
+        ("https://cogsarecool.com/cog.tif", HttpFilesystem),
+        ("s3://nobucket/cog.tif", S3Filesystem),
+    ],
+)
+def test_create_filesystem(infile, filesystem):
+    assert type(Filesystem.create_from_filepath(infile)) == filesystem
+
+
+def test_create_filesystem_unsupported():
+    with pytest.raises(NotImplementedError):
+        Filesystem.create_from_filepath("ftp://cogsarecool.com/cog.tif")
+
+
+@pytest.mark.parametrize("endian", ["<", ">"])
+def test_filesystem_read_integers(endian):
+    file_reader = Filesystem.create_from_filepath("cog.tif")
+    file_reader.set_endian(endian)
+    file_reader.data = struct.pack(f"{endian}HIQ", 42, 8, 2 ** 40)
+    assert file_reader.read_u16() == 42
+    assert file_reader.read_u32() == 8
+    assert file_reader.read_u64() == 2 ** 40
+    assert file_reader.tell() == 14
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "chunk_size,request_count,header_size",
@@ -1,20 +1,28 @@
+import asyncio
+import logging
+import os
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import aiohttp
 import mercantile
 import numpy as np
 import pytest
 import rasterio
+from PIL import Image
 from rasterio.warp import transform_bounds
 from rasterio.windows import Window
 from rio_tiler.io.cogeo import COGReader as cogeo_reader
 from rio_tiler.mercator import get_zooms
 from shapely.geometry import Polygon
 
-from aiocogeo import config
+import aiocogeo
+from aiocogeo import config, partial_reads
 from aiocogeo.errors import TileNotFoundError
+from aiocogeo.partial_reads import PartialReadInterface
 
-from .conftest import TEST_DATA
+from .conftest import DATA_DIR, TEST_DATA
 
 
 @pytest.mark.asyncio
@@ -198,6 +206,48 @@ async def test_cog_read_internal_mask(create_cog_reader):
         assert pytest.approx(frequencies[0][1] / np.prod(tile.shape), abs=0.002) == 0
 
 
+@pytest.mark.skipif(not partial_reads.has_cv2, reason="requires opencv")
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "infile",
+    [
+        "https://async-cog-reader-test-data.s3.amazonaws.com/naip_image_masked.tif",
+        "https://async-cog-reader-test-data.s3.amazonaws.com/int16_deflate.tif",
+        os.path.join(DATA_DIR, "cog.tif"),
+    ],
+)
+@pytest.mark.parametrize("shape", [(200, 190), (600, 700)])
+async def test_cog_read_opencv_resampling(
+    create_cog_reader, infile, shape, monkeypatch
+):
+    async with create_cog_reader(infile) as cog:
+        ifd = cog.ifds[0]
+        img_tiles = cog._calculate_image_tiles(
+            cog.native_bounds,
+            tile_width=ifd.TileWidth.value,
+            tile_height=ifd.TileHeight.value,
+            band_count=ifd.bands,
+            ovr_level=0,
+            dtype=ifd.dtype,
+        )
+        img_arr = await cog._request_tiles(img_tiles)
+        resampled = cog._postprocess(img_arr, img_tiles, shape, Image.NEAREST)
+
+        # OpenCV resampling matches PIL exactly (masked pixels aside)
+        monkeypatch.setattr(partial_reads, "has_cv2", False)
+        resampled_pil = cog._postprocess(img_arr, img_tiles, shape, Image.NEAREST)
+        assert np.array_equal(
+            np.ma.filled(resampled, 0), np.ma.filled(resampled_pil, 0)
+        )
+        assert np.array_equal(
+            np.ma.getmaskarray(resampled), np.ma.getmaskarray(resampled_pil)
+        )
+
+        # The mask can be modified in place
+        if np.ma.is_masked(resampled):
+            resampled.mask.flat[0] = True
+
+
 @pytest.mark.asyncio
 async def test_cog_read_nodata_value(create_cog_reader):
     infile_nodata = (
@@ -246,9 +296,13 @@ async def test_cog_read_merge_range_requests(create_cog_reader, monkeypatch):
         merged_request_count = cog.requests["count"]
         merged_bytes_requested = cog.requests["byte_count"]
 
-    # Confirm we got the same tile with fewer requests
+    # Confirm we got the same tile with fewer requests, merged requests also read the (small) gaps between tiles
     assert merged_request_count < request_count
-    assert bytes_requested == merged_bytes_requested
+    assert (
+        bytes_requested
+        <= merged_bytes_requested
+        <= bytes_requested + request_count * config.HTTP_MERGE_CONSECUTIVE_THRESHOLD
+    )
     assert tile_data.all() == tile_data_merged.all()
     assert tile_data.shape == tile_data_merged.shape
 
@@ -276,13 +330,117 @@ async def test_cog_read_merge_range_requests_with_internal_nodata_mask(
         merged_request_count = cog.requests["count"]
         merged_bytes_requested = cog.requests["byte_count"]
 
-    # Confirm we got the same tile with fewer requests
+    # Confirm we got the same tile with fewer requests, merged requests also read the (small) gaps between image and
+    # mask tiles
     assert merged_request_count < request_count
-    assert bytes_requested == merged_bytes_requested
+    assert (
+        bytes_requested
+        <= merged_bytes_requested
+        <= bytes_requested
+        + request_count
+        * max(config.HTTP_MERGE_CONSECUTIVE_THRESHOLD, config.MASK_MERGE_GAP)
+    )
     assert tile_data.all() == tile_data_merged.all()
     assert tile_data.shape == tile_data_merged.shape
 
 
+@pytest.mark.parametrize(
+    "threshold,expected",
+    [
+        (0, [(0, 300, [1, 0, 2]), (400, 500, [3])]),
+        (100, [(0, 500, [1, 0, 2, 3])]),
+    ],
+)
+def test_merge_range_requests(threshold, expected, monkeypatch):
+    monkeypatch.setattr(config, "HTTP_MERGE_CONSECUTIVE_THRESHOLD", threshold)
+    offsets = [100, 0, 200, 400]
+    byte_counts = [100, 100, 100, 100]
+    assert PartialReadInterface._merge_range_requests(offsets, byte_counts) == expected
+
+
+def test_merge_range_requests_with_mask(monkeypatch):
+    monkeypatch.setattr(config, "HTTP_MERGE_CONSECUTIVE_THRESHOLD", 0)
+    monkeypatch.setattr(config, "MASK_MERGE_GAP", 8)
+    # Image tiles interleaved with their mask tiles
+    offsets = [0, 158, 104, 262]
+    byte_counts = [100, 100, 50, 50]
+    is_mask = [False, False, True, True]
+    assert PartialReadInterface._merge_range_requests(
+        offsets, byte_counts, is_mask
+    ) == [(0, 312, [0, 2, 1, 3])]
+
+    # Ranges are not merged once the gaps are larger than MASK_MERGE_GAP
+    monkeypatch.setattr(config, "MASK_MERGE_GAP", 0)
+    assert len(
+        PartialReadInterface._merge_range_requests(offsets, byte_counts, is_mask)
+    ) == 4
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_tile_requests(create_cog_reader, monkeypatch):
+    monkeypatch.setattr(config, "MAX_CONCURRENT_TILE_REQUESTS", 2)
+    async with create_cog_reader(os.path.join(DATA_DIR, "cog.tif")) as cog:
+        get_tile = cog.get_tile
+        active = []
+        max_active = 0
+        max_tasks = 0
+
+        async def _get_tile(x, y, z):
+            nonlocal max_active, max_tasks
+            active.append((x, y))
+            max_active = max(max_active, len(active))
+            max_tasks = max(max_tasks, len(asyncio.all_tasks()))
+            try:
+                return await get_tile(x, y, z)
+            finally:
+                active.remove((x, y))
+
+        monkeypatch.setattr(cog, "get_tile", _get_tile)
+        ifd = cog.ifds[0]
+        img_tiles = cog._calculate_image_tiles(
+            cog.native_bounds,
+            ifd.TileWidth.value,
+            ifd.TileHeight.value,
+            ifd.bands,
+            0,
+            ifd.dtype,
+        )
+        await cog._request_tiles(img_tiles)
+        # Tiles are requested by a fixed number of workers rather than a task per tile
+        tile_count = (img_tiles.xmax - img_tiles.xmin + 1) * (
+            img_tiles.ymax - img_tiles.ymin + 1
+        )
+        assert tile_count > 100
+        assert max_active == 2
+        assert max_tasks < 10
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [0, -1])
+async def test_max_concurrent_tile_requests_no_limit(
+    create_cog_reader, monkeypatch, limit
+):
+    async with create_cog_reader(os.path.join(DATA_DIR, "cog.tif")) as cog:
+        ifd = cog.ifds[0]
+        img_tiles = cog._calculate_image_tiles(
+            cog.native_bounds,
+            ifd.TileWidth.value,
+            ifd.TileHeight.value,
+            ifd.bands,
+            0,
+            ifd.dtype,
+        )
+        tile_data = await cog._request_tiles(img_tiles)
+        tile_data_merged = await cog._request_merged_tiles(img_tiles)
+
+        # Every tile is still requested when there is no limit
+        monkeypatch.setattr(config, "MAX_CONCURRENT_TILE_REQUESTS", limit)
+        assert np.array_equal(await cog._request_tiles(img_tiles), tile_data)
+        assert np.array_equal(
+            await cog._request_merged_tiles(img_tiles), tile_data_merged
+        )
+
+
 @pytest.mark.asyncio
 async def test_boundless_read(create_cog_reader, monkeypatch):
     infile = (
@@ -326,6 +484,27 @@ async def test_boundless_read_fill_value(create_cog_reader, monkeypatch):
         assert counts[1] == 154889
 
 
+@pytest.mark.asyncio
+async def test_boundless_read_merge_range_requests(create_cog_reader, monkeypatch):
+    infile = (
+        "http://async-cog-reader-test-data.s3.amazonaws.com/webp_web_optimized_cog.tif"
+    )
+    tile = mercantile.Tile(x=701, y=1634, z=12)
+    bounds = mercantile.xy_bounds(tile)
+
+    async with create_cog_reader(infile) as cog:
+        tile_data = await cog.read(bounds=bounds, shape=(256, 256))
+
+        # Confirm tiles outside the image are filled the same way with merged range requests
+        monkeypatch.setattr(config, "HTTP_MERGE_CONSECUTIVE_RANGES", True)
+        tile_data_merged = await cog.read(bounds=bounds, shape=(256, 256))
+        assert np.array_equal(tile_data, tile_data_merged)
+
+        monkeypatch.setattr(config, "BOUNDLESS_READ", False)
+        with pytest.raises(TileNotFoundError):
+            await cog.read(bounds=bounds, shape=(256, 256))
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("infile", TEST_DATA)
 async def test_boundless_get_tile(create_cog_reader, infile, monkeypatch):
@@ -394,7 +573,8 @@ async def test_cog_get_overview_level(
 
 
 @pytest.mark.asyncio
-async def test_inject_session(create_cog_reader):
+async def test_inject_session(create_cog_reader, caplog):
+    caplog.set_level(logging.DEBUG, logger="aiocogeo.filesystems")
     async with aiohttp.ClientSession() as session:
         async with create_cog_reader(
             "https://async-cog-reader-test-data.s3.amazonaws.com/webp_cog.tif",
@@ -404,3 +584,123 @@ async def test_inject_session(create_cog_reader):
         # Confirm session is still open
         assert not session.closed
         assert session._trace_configs
+
+
+@pytest.mark.asyncio
+async def test_inject_session_without_tracing(create_cog_reader):
+    async with aiohttp.ClientSession() as session:
+        async with create_cog_reader(
+            "https://async-cog-reader-test-data.s3.amazonaws.com/webp_cog.tif",
+            kwargs={"session": session},
+        ) as cog:
+            # Request statistics don't rely on request traces
+            assert cog.requests["count"] > 0
+            assert cog.requests["ranges"]
+        # Trace config is only injected when debug logs are enabled
+        assert not session._trace_configs
+
+
+@pytest.mark.asyncio
+async def test_shared_session(create_cog_reader):
+    infile = "https://async-cog-reader-test-data.s3.amazonaws.com/webp_cog.tif"
+    async with create_cog_reader(infile) as cog:
+        session = cog._file_reader.session
+        async with create_cog_reader(infile) as other:
+            # Confirm the session is shared, but request statistics are not
+            assert other._file_reader.session is session
+            assert other.requests["count"] == cog.requests["count"]
+    # Confirm session is still open
+    assert not session.closed
+
+    await aiocogeo.close()
+    assert session.closed
+
+
+def test_shared_session_event_loop():
+    infile = "https://async-cog-reader-test-data.s3.amazonaws.com/webp_cog.tif"
+
+    async def _open():
+        async with aiocogeo.COGReader(infile) as cog:
+            return cog._file_reader.session
+
+    # Shared session is closed when the event loop shuts down
+    session = asyncio.run(_open())
+    assert session.closed
+
+    # Session left open on a previous event loop is closed and replaced
+    loop = asyncio.new_event_loop()
+    session = loop.run_until_complete(_open())
+    loop.close()
+    other = asyncio.run(_open())
+    assert session.closed
+    assert other is not session
+
+
+def test_shared_session_threads():
+    infile = "https://async-cog-reader-test-data.s3.amazonaws.com/webp_cog.tif"
+    opened = threading.Barrier(2)
+
+    async def _read():
+        async with aiocogeo.COGReader(infile) as cog:
+            # Both threads open a file before either reads from it
+            await asyncio.get_event_loop().run_in_executor(None, opened.wait)
+            await cog.get_tile(0, 0, 0)
+            session = cog._file_reader.session
+            assert not session.closed
+            return session
+
+    # Event loops running in other threads don't close each other's session
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(asyncio.run, _read()) for _ in range(2)]
+        sessions = [future.result() for future in futures]
+    assert sessions[0] is not sessions[1]
+    assert all(session.closed for session in sessions)
+
+
+@pytest.mark.asyncio
+async def test_shared_s3_resource(create_cog_reader):
+    infile = "s3://async-cog-reader-test-data/lzw_cog.tif"
+    async with create_cog_reader(infile) as cog:
+        assert cog._file_reader.object.key == "lzw_cog.tif"
+        async with create_cog_reader(infile) as other:
+            # Confirm the resource is shared across files
+            assert other._file_reader.resource is cog._file_reader.resource
+
+    await aiocogeo.close_s3()
+    assert asyncio.get_event_loop() not in aiocogeo.filesystems._S3_RESOURCES
+
+
+def test_shared_s3_resource_event_loop():
+    infile = "s3://async-cog-reader-test-data/lzw_cog.tif"
+
+    async def _open():
+        async with aiocogeo.COGReader(infile) as cog:
+            return cog._file_reader.resource
+
+    # Resource left open on a previous event loop is closed and replaced
+    loop = asyncio.new_event_loop()
+    resource = loop.run_until_complete(_open())
+    _, closer = aiocogeo.filesystems._S3_RESOURCES[loop]
+    loop.close()
+    other = asyncio.run(_open())
+    assert other is not resource
+    # The async generator holding the resource open has exited
+    assert closer.ag_frame is None
+
+
+def test_shared_s3_resource_threads():
+    infile = "s3://async-cog-reader-test-data/lzw_cog.tif"
+    opened = threading.Barrier(2)
+
+    async def _read():
+        async with aiocogeo.COGReader(infile) as cog:
+            # Both threads open a file before either reads from it
+            await asyncio.get_event_loop().run_in_executor(None, opened.wait)
+            await cog.get_tile(0, 0, 0)
+            return cog._file_reader.resource
+
+    # Event loops running in other threads don't close each other's resource
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(asyncio.run, _read()) for _ in range(2)]
+        resources = [future.result() for future in futures]
+    assert resources[0] is not resources[1]